@@ -61,6 +61,12 @@ PaymentForm.include({
     _bindSquareCard: function ($checkedRadio) {
         var self = this;
         var acquirer_id = this.getAcquirerIdFromRadio($checkedRadio);
+        if (this.paymentForm && this.squareAcquirerId === acquirer_id) {
+            // the card form of this acquirer is already built, keep the existing instance
+            return;
+        }
+        this._unbindSquareCard();
+        this.squareAcquirerId = acquirer_id;
         var acquirer_form = this.$('#o_payment_add_token_acq_' + acquirer_id);
         var input_form = $('input', acquirer_form);
         var formData = this.getFormData(input_form);
@@ -70,6 +76,13 @@ PaymentForm.include({
                 elementId: 'sq-card',
             },
             callbacks: {
+                /*
+                * callback function: paymentFormLoaded
+                * Triggered when: SqPaymentForm is fully loaded and the card fields are interactive
+                */
+                paymentFormLoaded: function () {
+                    self._reportSquareTimeToInteractive();
+                },
                 /*
                 * callback function: cardNonceResponseReceived
                 * Triggered when: SqPaymentForm completes a card nonce request
@@ -139,6 +152,7 @@ PaymentForm.include({
             this.paymentForm.destroy();
         }
         this.paymentForm = undefined;
+        this.squareAcquirerId = undefined;
         this.square_card_nonce = undefined;
         this.cardData = {};
     },
@@ -149,6 +163,26 @@ PaymentForm.include({
             return ajax.loadJS("https://js.squareupsandbox.com/v2/paymentform");
         }
     },
+    /**
+     * Reports the time elapsed between the selection of Square and the card
+     * form becoming interactive, through the User Timing API and the core bus.
+     *
+     * @private
+     */
+    _reportSquareTimeToInteractive: function () {
+        if (this.squareLoadStart === undefined || !window.performance) {
+            return;
+        }
+        var duration = performance.now() - this.squareLoadStart;
+        this.squareLoadStart = undefined;
+        if (performance.measure) {
+            performance.measure('square_card_form_tti', 'square_card_form_start');
+        }
+        core.bus.trigger('square_card_form_ready', {
+            acquirer_id: this.squareAcquirerId,
+            time_to_interactive: duration,
+        });
+    },
     /**
      * @override
      */
@@ -162,10 +196,16 @@ PaymentForm.include({
         }
         var def;
         if (provider === 'square') {
+            var willBuild = !this.paymentForm || this.squareAcquirerId !== this.getAcquirerIdFromRadio($checkedRadio);
+            if (willBuild && this.isNewPaymentRadio($checkedRadio) && window.performance) {
+                this.squareLoadStart = performance.now();
+                if (performance.mark) {
+                    performance.mark('square_card_form_start');
+                }
+            }
             def = this._ajaxloadJSSquare(state)
             $.when(def).then(function() {
-                // always re-init Square (in case of multiple acquirers for Square, make sure the square instance is using the right key)
-                self._unbindSquareCard();
+                // the instance is only re-init when the acquirer changes (in case of multiple acquirers for Square, make sure the square instance is using the right key)
                 if (self.isNewPaymentRadio($checkedRadio)) {
                     self._bindSquareCard($checkedRadio);
                 }